@@ -131,7 +131,12 @@ class App:
         send: TASGISend,
     ) -> None:
         """Convert the given scope into a request and process."""
-        await self.lifespan(scope, receive, send)
+        lifespan = self.lifespan
+        if scope["type"] == "lifespan":
+            return await lifespan(scope, receive, send)
+
+        # Call the middlewares stack directly to skip the lifespan dispatching
+        return await lifespan.app(scope, receive, send)
 
     async def __process__(
         self,
@@ -169,7 +174,11 @@ class App:
     ) -> Optional[Response]:
         """Find and call a callback, parse a response, handle exceptions."""
         scope = request.scope
-        path = f"{ scope.get('root_path', '') }{ scope['path'] }"
+        path = scope["path"]
+        root_path = scope.get("root_path")
+        if root_path:
+            path = f"{root_path}{path}"
+
         try:
             match = self.router(path, scope.get("method", "GET"))
 
@@ -183,7 +192,7 @@ class App:
         response = await match.target(request)  # type: ignore[]
 
         if scope["type"] == "http":
-            return parse_response(response)
+            return response if isinstance(response, Response) else parse_response(response)
 
         # TODO: Do we need to close websockets automatically?
         # if scope_type == "websocket" send websocket.close
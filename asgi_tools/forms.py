@@ -8,8 +8,8 @@ from urllib.parse import unquote_to_bytes
 
 from multidict import MultiDict
 
+from .headers import parse_options_header
 from .multipart import BaseParser, MultipartParser, QueryStringParser
-from .utils import parse_options_header
 
 if TYPE_CHECKING:
     from asgi_tools.request import Request
@@ -166,5 +166,5 @@ class MultipartReader(FormReader):
 
 
 def unquote_plus(value: bytearray) -> bytes:
-    value = value.replace(b"+", b" ")
-    return unquote_to_bytes(bytes(value))
+    # bytes.replace returns the same object when there is nothing to replace
+    return unquote_to_bytes(bytes(value).replace(b"+", b" "))
@@ -10,7 +10,7 @@ from urllib.parse import unquote_to_bytes
 from multidict import MultiDict
 
 from .multipart cimport QueryStringParser, MultipartParser, BaseParser
-from .utils import parse_options_header
+from .headers import parse_options_header
 
 
 async def read_formdata(object request, int max_size, object upload_to,
@@ -149,10 +149,11 @@ cdef dict _hextobyte = {
 
 
 cdef bytes unquote_plus(value: bytes):
-    value = value.replace(b'+', b' ')
-    bits = value.split(b'%')
-    if len(bits) == 1:
+    if b'+' in value:
+        value = value.replace(b'+', b' ')
+    if b'%' not in value:
         return value
+    bits = value.split(b'%')
     res = bits[0]
     for item in bits[1:]:
         try:
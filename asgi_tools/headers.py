@@ -0,0 +1,76 @@
+"""Parse HTTP headers with options (Content-Type, Content-Disposition and etc).
+
+The module is accelerated with Cython (see headers.pyx).
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Tuple
+from urllib.parse import unquote_to_bytes
+
+OPTION_HEADER_PIECE_RE = re.compile(
+    r"""
+    \s*,?\s*  # newlines were replaced with commas
+    (?P<key>
+        "[^"\\]*(?:\\.[^"\\]*)*"  # quoted string
+    |
+        [^\s;,=*]+  # token
+    )
+    (?:\*(?P<count>\d+))?  # *1, optional continuation index
+    \s*
+    (?:  # optionally followed by =value
+        (?:  # equals sign, possibly with encoding
+            \*\s*=\s*  # * indicates extended notation
+            (?:  # optional encoding
+                (?P<encoding>[^\s]+?)
+                '(?P<language>[^\s]*?)'
+            )?
+        |
+            =\s*  # basic notation
+        )
+        (?P<value>
+            "[^"\\]*(?:\\.[^"\\]*)*"  # quoted string
+        |
+            [^;,]+  # token
+        )?
+    )?
+    \s*;?
+    """,
+    flags=re.VERBOSE,
+)
+
+
+def parse_options_header(value: str) -> Tuple[str, Dict[str, str]]:
+    """Parse the given content disposition header."""
+
+    options: Dict[str, str] = {}
+    if not value:
+        return "", options
+
+    if ";" not in value:
+        return value.strip(), options
+
+    ctype, rest = value.split(";", 1)
+    pos, size = 0, len(rest)
+    while pos < size:
+        match = OPTION_HEADER_PIECE_RE.match(rest, pos)
+        if not match:
+            break
+
+        option, count, encoding, _, value = match.groups()
+        # Option names are case-insensitive
+        option = option.lower()
+        if value is None:
+            value = ""
+
+        else:
+            if encoding is not None:
+                value = unquote_to_bytes(value).decode(encoding)
+
+            if count:
+                value = options.get(option, "") + value
+
+        options[option] = value.strip('" ').replace("\\\\", "\\").replace('\\"', '"')
+        pos = match.end()
+
+    return ctype.strip(), options
@@ -0,0 +1,147 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""Parse HTTP headers with options (Content-Type, Content-Disposition and etc).
+
+The parser scans the header once without regular expressions and follows the rules of
+OPTION_HEADER_PIECE_RE from headers.py.
+"""
+
+from urllib.parse import unquote_to_bytes
+
+
+cdef inline Py_ssize_t skip_spaces(str value, Py_ssize_t pos, Py_ssize_t size):
+    while pos < size and value[pos].isspace():
+        pos += 1
+    return pos
+
+
+cdef Py_ssize_t skip_quoted(str value, Py_ssize_t pos, Py_ssize_t size):
+    """Return a position after the quoted string or -1 if the string is invalid."""
+    cdef Py_UCS4 char
+
+    pos += 1
+    while pos < size:
+        char = value[pos]
+        if char == u'"':
+            return pos + 1
+
+        if char == u'\\':
+            if pos + 1 >= size or value[pos + 1] == u'\n':
+                return -1
+            pos += 1
+
+        pos += 1
+
+    return -1
+
+
+cpdef tuple parse_options_header(str value):
+    """Parse the given content disposition header."""
+
+    cdef dict options = {}
+    if not value:
+        return '', options
+
+    if ';' not in value:
+        return value.strip(), options
+
+    cdef str ctype, rest, option, count, encoding, data
+    cdef Py_ssize_t pos, end, mark, size
+    cdef Py_UCS4 char
+
+    ctype, rest = value.split(';', 1)
+    pos, size = 0, len(rest)
+    while pos < size:
+        pos = skip_spaces(rest, pos, size)
+        if pos < size and rest[pos] == u',':
+            pos = skip_spaces(rest, pos + 1, size)
+
+        # Option name: a quoted string or a token
+        end = -1
+        if pos < size and rest[pos] == u'"':
+            end = skip_quoted(rest, pos, size)
+
+        if end < 0:
+            end = pos
+            while end < size:
+                char = rest[end]
+                if char.isspace() or char in u';,=*':
+                    break
+                end += 1
+
+            if end == pos:
+                break
+
+        option = rest[pos:end]
+        pos = end
+
+        # Continuation index: *1
+        count = None
+        if pos + 1 < size and rest[pos] == u'*' and rest[pos + 1].isdecimal():
+            mark = pos + 1
+            pos += 2
+            while pos < size and rest[pos].isdecimal():
+                pos += 1
+            count = rest[mark:pos]
+
+        pos = skip_spaces(rest, pos, size)
+
+        # Value: basic (=value) or extended (*=encoding'language'value) notation
+        encoding = data = None
+        mark = -1
+        if pos < size and rest[pos] == u'*':
+            end = skip_spaces(rest, pos + 1, size)
+            if end < size and rest[end] == u'=':
+                mark = skip_spaces(rest, end + 1, size)
+
+                # Optional encoding'language'
+                end = mark + 1
+                while end < size and rest[end] != u"'" and not rest[end].isspace():
+                    end += 1
+
+                if mark < size and not rest[mark].isspace() and end < size and rest[end] == u"'":
+                    pos = end + 1
+                    while pos < size and rest[pos] != u"'" and not rest[pos].isspace():
+                        pos += 1
+
+                    if pos < size and rest[pos] == u"'":
+                        encoding = rest[mark:end]
+                        mark = pos + 1
+
+        elif pos < size and rest[pos] == u'=':
+            mark = skip_spaces(rest, pos + 1, size)
+
+        if mark >= 0:
+            pos = mark
+            end = -1
+            if pos < size and rest[pos] == u'"':
+                end = skip_quoted(rest, pos, size)
+
+            if end < 0:
+                end = pos
+                while end < size and rest[end] != u';' and rest[end] != u',':
+                    end += 1
+
+            if end > pos:
+                data = rest[pos:end]
+                pos = end
+
+        pos = skip_spaces(rest, pos, size)
+        if pos < size and rest[pos] == u';':
+            pos += 1
+
+        # Option names are case-insensitive
+        option = option.lower()
+        if data is None:
+            data = ''
+
+        else:
+            if encoding is not None:
+                data = unquote_to_bytes(data).decode(encoding)
+
+            if count:
+                data = options.get(option, '') + data
+
+        options[option] = data.strip('" ').replace('\\\\', '\\').replace('\\"', '"')
+
+    return ctype.strip(), options
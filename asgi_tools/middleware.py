@@ -5,12 +5,15 @@ from __future__ import annotations
 import abc
 from contextvars import ContextVar
 from functools import partial
+from http import HTTPStatus
 from inspect import isawaitable
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Awaitable,
     Callable,
+    Dict,
     Final,
     List,
     Mapping,
@@ -22,6 +25,7 @@ from typing import (
 
 from http_router import Router
 
+from .constants import BASE_ENCODING
 from .errors import ASGIError
 from .logs import logger
 from .request import Request
@@ -31,6 +35,22 @@ from .utils import to_awaitable
 if TYPE_CHECKING:
     from .types import TASGIApp, TASGIMessage, TASGIReceive, TASGIScope, TASGISend
 
+NOT_FOUND_BODY: Final = HTTPStatus.NOT_FOUND.description.encode(BASE_ENCODING)
+NOT_FOUND_LENGTH: Final = str(len(NOT_FOUND_BODY)).encode(BASE_ENCODING)
+EMPTY_PARAMS: Final[Mapping] = MappingProxyType({})
+
+
+async def default404(_: TASGIScope, __: TASGIReceive, send: TASGISend):
+    """Respond with 404 Not Found (the default application for middlewares)."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": HTTPStatus.NOT_FOUND.value,
+            "headers": [(b"content-length", NOT_FOUND_LENGTH)],
+        },
+    )
+    await send({"type": "http.response.body", "body": NOT_FOUND_BODY})
+
 
 class BaseMiddeware(metaclass=abc.ABCMeta):
     """Base class for ASGI-Tools middlewares."""
@@ -72,7 +92,7 @@ class BaseMiddeware(metaclass=abc.ABCMeta):
 
     def bind(self, app: Optional[TASGIApp] = None):
         """Rebind the middleware to an ASGI application if it has been inited already."""
-        self.app = app or ResponseError.NOT_FOUND()
+        self.app = app or default404
         return self
 
 
@@ -141,8 +161,10 @@ class ResponseMiddleware(BaseMiddeware):
         """Parse responses from callbacks."""
 
         try:
-            result = await self.app(scope, receive, self.send)
-            response = parse_response(result)
+            response = await self.app(scope, receive, self.send)
+            if not isinstance(response, Response):
+                response = parse_response(response)
+
             await response(scope, receive, send)
 
         except (ResponseError, ResponseRedirect) as exc:
@@ -208,6 +230,9 @@ class LifespanMiddleware(BaseMiddeware):
         async def start():
             print('The app is finishing')
 
+    The handlers are called one by one in the order of registration, so a handler may rely on
+    the previous ones (ex. a cache warmup after a database connection).
+
     Lifespan middleware may be used as an async context manager for testing purposes
 
     .. code-block: python
@@ -281,7 +306,7 @@ class LifespanMiddleware(BaseMiddeware):
     async def run(self, event: str, _: Optional[TASGISend] = None):
         """Run startup/shutdown handlers."""
         assert event in {"startup", "shutdown"}
-        handlers = getattr(self, f"__{event}__")
+        handlers = self.__startup__ if event == "startup" else self.__shutdown__
 
         for handler in handlers:
             try:
@@ -363,7 +388,8 @@ class RouterMiddleware(BaseMiddeware):
             response = ResponseHTML(str(first * second))
             await response(scope, receive, send)
 
-    Path parameters are made available in the request/scope, as the ``path_params`` dictionary.
+    Path parameters are made available in the request/scope, as the ``path_params`` mapping.
+    Routes without parameters get a shared read-only empty mapping, copy it before changing.
 
     """
 
@@ -375,27 +401,72 @@ class RouterMiddleware(BaseMiddeware):
         """Initialize HTTP router."""
         super().__init__(app)
         self.router = router or Router(validator=callable)
+        self._static: Dict[Tuple[Optional[str], str], Callable] = {}
+        self.__build_static__()
 
     async def __process__(self, scope: TASGIScope, *args):
         """Get an app and process."""
         app, scope["path_params"] = self.__dispatch__(scope)
         return await app(scope, *args)
 
-    def __dispatch__(self, scope: TASGIScope) -> Tuple[Callable, Optional[Mapping]]:
+    def __dispatch__(self, scope: TASGIScope) -> Tuple[Callable, Mapping]:
         """Lookup for a callback."""
-        path = f"{scope.get('root_path', '')}{scope['path']}"
-        try:
-            match = self.router(path, scope["method"])
-
-        except self.router.RouterError:
-            return self.app, {}
+        router = self.router
+        path = scope["path"]
+        root_path = scope.get("root_path")
+        if root_path:
+            path = f"{root_path}{path}"
+
+        if router.trim_last_slash:
+            path = path.rstrip("/")
+
+        # Plain routes are resolved with a single dict lookup
+        method = scope["method"]
+        static = self._static
+        if static:
+            target = static.get((method, path)) or static.get((None, path))
+            if target is not None:
+                return target, EMPTY_PARAMS
+
+        # Call the router's matcher directly to avoid raising exceptions on misses
+        match = router.match(path, method)
+        if not match:
+            return self.app, EMPTY_PARAMS
+
+        # Copy params as the matches are cached by the router
+        params = match.params
+        return match.target, EMPTY_PARAMS if params is None else dict(params)
+
+    def __build_static__(self):
+        """Index the router's plain routes by method and path."""
+        static = self._static
+        static.clear()
+        for path, routes in self.router.plain.items():
+            for route in routes:
+                # The first route which accepts any method shadows the rest
+                if route.methods is None:
+                    static.setdefault((None, path), route.target)
+                    break
 
-        else:
-            return match.target, match.params  # type: ignore[]
+                for method in route.methods:
+                    static.setdefault((method, path), route.target)
 
     def route(self, *args, **kwargs):
         """Register a route."""
-        return self.router.route(*args, **kwargs)
+        register = self.router.route(*args, **kwargs)
+
+        def wrapper(target):
+            target = register(target)
+            self.__build_static__()
+
+            # The router memoizes matches (misses included)
+            cache_clear = getattr(self.router.match, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+            return target
+
+        return wrapper
 
 
 class StaticFilesMiddleware(BaseMiddeware):
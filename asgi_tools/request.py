@@ -4,20 +4,19 @@ incoming request.
 
 from __future__ import annotations
 
-from http import cookies
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, Iterator, Optional, Union
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qsl
 
+from multidict import MultiDict, MultiDictProxy
 from yarl import URL
 
 from ._compat import json_loads
-from .constants import DEFAULT_CHARSET
+from .constants import BASE_ENCODING, DEFAULT_CHARSET
 from .errors import ASGIDecodeError
 from .forms import read_formdata
+from .headers import parse_options_header
 from .types import TJSON, TASGIReceive, TASGIScope, TASGISend
-from .utils import CIMultiDict, parse_headers, parse_options_header
-
-if TYPE_CHECKING:
-    from multidict import MultiDict
+from .utils import CIMultiDict, get_header, parse_cookies, parse_headers
 
 
 class Request(TASGIScope):
@@ -35,6 +34,7 @@ class Request(TASGIScope):
         "send",
         "_is_read",
         "_url",
+        "_query",
         "_body",
         "_form",
         "_headers",
@@ -50,6 +50,7 @@ class Request(TASGIScope):
 
         self._is_read: bool = False
         self._url: Optional[URL] = None
+        self._query: Optional[MultiDictProxy] = None
         self._body: Optional[bytes] = None
         self._form: Optional[MultiDict] = None
         self._headers: Optional[CIMultiDict] = None
@@ -96,6 +97,48 @@ class Request(TASGIScope):
         """Copy the request to a new one."""
         return Request(dict(self.scope, **mutations), self.receive, self.send)
 
+    # Read the common scope keys directly, without the `__getattr__` fallback
+
+    @property
+    def type(self) -> str:
+        """Get the scope's type (http, websocket)."""
+        return self.scope["type"]
+
+    @property
+    def method(self) -> str:
+        """Get the request's HTTP method."""
+        return self.scope["method"]
+
+    @property
+    def path(self) -> str:
+        """Get the request's path."""
+        return self.scope["path"]
+
+    @property
+    def root_path(self) -> str:
+        """Get the application's root path."""
+        return self.scope["root_path"]
+
+    @property
+    def query_string(self) -> bytes:
+        """Get the request's raw query string."""
+        return self.scope["query_string"]
+
+    @property
+    def scheme(self) -> str:
+        """Get the request's URL scheme."""
+        return self.scope["scheme"]
+
+    @property
+    def http_version(self) -> str:
+        """Get the request's HTTP version."""
+        return self.scope["http_version"]
+
+    @property
+    def client(self) -> Any:
+        """Get the client's (host, port)."""
+        return self.scope["client"]
+
     @property
     def url(self) -> URL:
         """A lazy property that parses the current URL and returns :class:`yarl.URL` object.
@@ -113,14 +156,17 @@ class Request(TASGIScope):
         """
         if self._url is None:
             scope = self.scope
-            host = self.headers.get("host")
-            if host is None:
-                if "server" in scope:
-                    host, port = scope["server"]
-                    if port:
-                        host = f"{host}:{port}"
-                else:
-                    host = "localhost"
+            raw_host = get_header(scope["headers"], b"host")
+            if raw_host is not None:
+                host = raw_host.decode(BASE_ENCODING)
+
+            elif "server" in scope:
+                host, port = scope["server"]
+                if port:
+                    host = f"{host}:{port}"
+
+            else:
+                host = "localhost"
 
             self._url = URL.build(
                 host=host,
@@ -162,12 +208,8 @@ class Request(TASGIScope):
 
         """
         if self._cookies is None:
-            self._cookies = {}
-            cookie = self.headers.get("cookie")
-            if cookie:
-                for chunk in cookie.split(";"):
-                    key, _, val = chunk.partition("=")
-                    self._cookies[key.strip()] = cookies._unquote(val.strip())
+            cookie = get_header(self.scope["headers"], b"cookie")
+            self._cookies = parse_cookies(cookie) if cookie else {}
 
         return self._cookies
 
@@ -175,8 +217,10 @@ class Request(TASGIScope):
     def media(self) -> Dict[str, str]:
         """Prepare a media data for the request."""
         if self._media is None:
-            conten_type_header = self.headers.get("content-type", "")
-            content_type, opts = parse_options_header(conten_type_header)
+            # Read the raw header to skip decoding the others
+            header = get_header(self.scope["headers"], b"content-type")
+            header_value = header.decode(BASE_ENCODING) if header else ""
+            content_type, opts = parse_options_header(header_value)
             self._media = dict(opts, content_type=content_type)
 
         return self._media
@@ -187,12 +231,21 @@ class Request(TASGIScope):
         return self.media.get("charset", DEFAULT_CHARSET)
 
     @property
-    def query(self) -> MultiDict:
+    def query(self) -> MultiDictProxy:
         """A lazy property that parse the current query string and returns it as a
         :py:class:`multidict.MultiDict`.
 
+        The query string is parsed with :py:func:`urllib.parse.parse_qsl`: invalid
+        percent-escapes (``a=%FF``) are decoded as U+FFFD and raw non-ASCII bytes as
+        latin-1, so the result may differ from ``request.url.query`` for such queries.
+
         """
-        return self.url.query
+        # Parse the query string directly, without building the whole URL
+        if self._query is None:
+            query_string = self.scope["query_string"].decode(BASE_ENCODING)
+            self._query = MultiDictProxy(MultiDict(parse_qsl(query_string, keep_blank_values=True)))
+
+        return self._query
 
     @property
     def content_type(self) -> str:
@@ -211,18 +264,16 @@ class Request(TASGIScope):
             variable if you need.
 
         """
-        if self._is_read:
-            if self._body is None:
-                raise RuntimeError("Stream has been read")  # noqa:
+        if self._is_read and self._body is not None:
             yield self._body
 
         else:
-            self._is_read = True
-            message = await self.receive()
-            yield message.get("body", b"")
-            while message.get("more_body"):
-                message = await self.receive()
-                yield message.get("body", b"")
+            self.__start_reading__()
+            chunk, more_body = await self.__receive_chunk__()
+            yield chunk
+            while more_body:
+                chunk, more_body = await self.__receive_chunk__()
+                yield chunk
 
     async def body(self) -> bytes:
         """Read and return the request's body as bytes.
@@ -230,10 +281,31 @@ class Request(TASGIScope):
         `body = await request.body()`
         """
         if self._body is None:
-            self._body = b"".join([chunk async for chunk in self.stream()])
+            # Skip the stream's generator, most of bodies come in a single message
+            self.__start_reading__()
+            body, more_body = await self.__receive_chunk__()
+            if more_body:
+                chunks = [body]
+                while more_body:
+                    chunk, more_body = await self.__receive_chunk__()
+                    chunks.append(chunk)
+                body = b"".join(chunks)
+
+            self._body = body
 
         return self._body
 
+    def __start_reading__(self):
+        """Mark the body as read, the body can be received only once."""
+        if self._is_read:
+            raise RuntimeError("Stream has been read")  # noqa:
+        self._is_read = True
+
+    async def __receive_chunk__(self) -> Tuple[bytes, bool]:
+        """Receive a chunk of the body and check that more chunks follow."""
+        message = await self.receive()
+        return message.get("body", b""), message.get("more_body", False)
+
     async def text(self) -> str:
         """Read and return the request's body as a string.
 
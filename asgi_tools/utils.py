@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import re
-from functools import wraps
+from functools import lru_cache, wraps
+from http import cookies
 from inspect import isasyncgenfunction, iscoroutinefunction
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Tuple, overload
-from urllib.parse import unquote_to_bytes
+from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Optional, overload
 
 from multidict import CIMultiDict
 
 from .constants import BASE_ENCODING
+from .headers import parse_options_header  # noqa: F401
 
 if TYPE_CHECKING:
     from .types import TV, TASGIHeaders, TVAsyncCallable
@@ -45,68 +45,43 @@ def to_awaitable(fn: Callable):
 
 def parse_headers(headers: TASGIHeaders) -> CIMultiDict:
     """Decode the given headers list."""
-    return CIMultiDict(
-        [(n.decode(BASE_ENCODING), v.decode(BASE_ENCODING)) for n, v in headers],
-    )
-
-
-OPTION_HEADER_PIECE_RE = re.compile(
-    r"""
-    \s*,?\s*  # newlines were replaced with commas
-    (?P<key>
-        "[^"\\]*(?:\\.[^"\\]*)*"  # quoted string
-    |
-        [^\s;,=*]+  # token
-    )
-    (?:\*(?P<count>\d+))?  # *1, optional continuation index
-    \s*
-    (?:  # optionally followed by =value
-        (?:  # equals sign, possibly with encoding
-            \*\s*=\s*  # * indicates extended notation
-            (?:  # optional encoding
-                (?P<encoding>[^\s]+?)
-                '(?P<language>[^\s]*?)'
-            )?
-        |
-            =\s*  # basic notation
-        )
-        (?P<value>
-            "[^"\\]*(?:\\.[^"\\]*)*"  # quoted string
-        |
-            [^;,]+  # token
-        )?
-    )?
-    \s*;?
-    """,
-    flags=re.VERBOSE,
-)
-
-
-def parse_options_header(value: str) -> Tuple[str, Dict[str, str]]:
-    """Parse the given content disposition header."""
-
-    options: Dict[str, str] = {}
-    if not value:
-        return "", options
-
-    if ";" not in value:
-        return value, options
-
-    ctype, rest = value.split(";", 1)
-    while rest:
-        match = OPTION_HEADER_PIECE_RE.match(rest)
-        if not match:
-            break
-
-        option, count, encoding, _, value = match.groups()
-        if value is not None:
-            if encoding is not None:
-                value = unquote_to_bytes(value).decode(encoding)
-
-            if count:
-                value = options.get(option, "") + value
-
-        options[option] = value.strip('" ').replace("\\\\", "\\").replace('\\"', '"')
-        rest = rest[match.end() :]
-
-    return ctype, options
+    # Filling the multidict directly is cheaper than building it from an intermediate list
+    result: CIMultiDict = CIMultiDict()
+    add = result.add
+    for name, value in headers:
+        add(name.decode(BASE_ENCODING), value.decode(BASE_ENCODING))
+
+    return result
+
+
+def get_header(headers: TASGIHeaders, name: bytes) -> Optional[bytes]:
+    """Find the first raw header by the given lowercase name without decoding the others.
+
+    Header names are compared case-insensitively, servers may keep the original case.
+    """
+    for key, value in headers:
+        if key == name or key.lower() == name:
+            return value
+
+    return None
+
+
+def parse_cookies(cookie: bytes) -> Dict[str, str]:
+    """Parse the given cookie header."""
+    return dict(_parse_cookies(cookie))
+
+
+@lru_cache(maxsize=256)
+def _parse_cookies(cookie: bytes) -> Dict[str, str]:
+    """Clients send the same cookies with every request, so the results are cached.
+
+    The returned dictionary is shared, use :py:func:`parse_cookies` to get a copy.
+    """
+    result: Dict[str, str] = {}
+    for chunk in cookie.decode(BASE_ENCODING).split(";"):
+        key, _, val = chunk.partition("=")
+        val = val.strip()
+        # Only quoted values need unquoting, the most of cookies aren't quoted
+        result[key.strip()] = cookies._unquote(val) if val[:1] == '"' else val
+
+    return result
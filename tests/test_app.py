@@ -53,6 +53,15 @@ async def test_app(client_cls):
     assert res.status_code == 200
     assert await res.text() == "42"
 
+    @app.route("/path_params/change")
+    async def path_params_change(request):
+        request.path_params["changed"] = True
+        return request.path_params
+
+    res = await client.get("/path_params/change")
+    assert res.status_code == 200
+    assert await res.json() == {"changed": True}
+
     @app.route("/sync")
     def sync_fn(request):
         return "Sync is ok"
@@ -54,6 +54,7 @@ async def test_formdata(gen_request, tmp_path):
         (b"foo=bar&&another=asdf", {"foo": "bar", "another": "asdf"}),
         (b"foo=bar&blank&another=asdf", {"another": "asdf", "blank": "", "foo": "bar"}),
         (b"value=test%20passed", {"value": "test passed"}),
+        (b"value=test+passed&sum=1%2B2", {"value": "test passed", "sum": "1+2"}),
     ],
 )
 def test_query(sample):
@@ -88,6 +88,26 @@ async def test_lifespan_middleware(client_cls):
     assert ["started", "finished"] == side_effects
 
 
+async def test_lifespan_middleware_order(client_cls):
+    from asgi_tools import LifespanMiddleware
+    from asgi_tools._compat import aio_sleep
+
+    side_effects = []
+
+    async def connect():
+        await aio_sleep(1e-2)
+        side_effects.append("connect")
+
+    app = LifespanMiddleware(
+        lambda scope, receive, send: None,
+        on_startup=[connect, lambda: side_effects.append("warmup")],
+    )
+    client = client_cls(app)
+
+    async with client.lifespan():
+        assert side_effects == ["connect", "warmup"]
+
+
 async def test_lifespan_middleware_errors(client_cls):
     from asgi_tools import LifespanMiddleware
 
@@ -150,6 +170,7 @@ async def test_router_middleware(client_cls):
     res = await client.get("/")
     assert res.status_code == 404
     assert await res.text() == "Nothing matches the given URI"
+    assert res.headers["content-length"] == "29"
 
     res = await client.get("/page1")
     assert res.status_code == 200
@@ -186,6 +207,125 @@ async def test_router_middleware2(client_cls):
     assert await res.text() == "page1"
 
 
+async def test_router_middleware_static(client_cls):
+    from asgi_tools import ResponseMiddleware, RouterMiddleware
+
+    router = RouterMiddleware()
+    app = ResponseMiddleware(router)
+
+    @router.route("/page", methods=["POST"])
+    async def page_post(scope, receive, send):
+        return f"post {dict(scope['path_params'])}"
+
+    @router.route("/page")
+    async def page_any(scope, receive, send):
+        return "any"
+
+    @router.route("/page", methods=["PUT"])
+    async def page_put(scope, receive, send):
+        return "put"
+
+    router.router.route("/direct")(page_any)
+
+    assert router._static == {("POST", "/page"): page_post, (None, "/page"): page_any}
+
+    client = client_cls(app)
+    res = await client.post("/page")
+    assert await res.text() == "post {}"
+
+    res = await client.get("/page")
+    assert await res.text() == "any"
+
+    res = await client.put("/page")
+    assert await res.text() == "any"
+
+    res = await client.get("/direct")
+    assert await res.text() == "any"
+
+
+async def test_router_middleware_cache(client_cls):
+    from asgi_tools import ResponseError, ResponseMiddleware, RouterMiddleware
+
+    async def page404(scope, receive, send):
+        return ResponseError.NOT_FOUND()
+
+    router = RouterMiddleware(page404)
+    app = ResponseMiddleware(router)
+
+    @router.route("/user/{id}")
+    async def user(scope, receive, send):
+        params = scope["path_params"]
+        assert "seen" not in params
+        params["seen"] = True
+        return f"user {params['id']}"
+
+    client = client_cls(app)
+    for _ in range(2):
+        res = await client.get("/user/1")
+        assert await res.text() == "user 1"
+
+    # Cached misses are dropped when a route is registered
+    res = await client.get("/item/1")
+    assert res.status_code == 404
+
+    @router.route("/item/{id}")
+    async def item(scope, receive, send):
+        return f"item {scope['path_params']['id']}"
+
+    res = await client.get("/item/1")
+    assert await res.text() == "item 1"
+
+
+async def test_router_middleware_trim_last_slash(client_cls):
+    from http_router import Router
+
+    from asgi_tools import ResponseMiddleware, RouterMiddleware
+
+    router = RouterMiddleware(router=Router(trim_last_slash=True, validator=callable))
+    app = ResponseMiddleware(router)
+
+    @router.route("/page1/")
+    async def page1(scope, receive, send):
+        return "page1"
+
+    client = client_cls(app)
+    res = await client.get("/page1")
+    assert res.status_code == 200
+    assert await res.text() == "page1"
+
+    res = await client.get("/page1/")
+    assert res.status_code == 200
+    assert await res.text() == "page1"
+
+
+def test_router_middleware_root_path():
+    from asgi_tools import RouterMiddleware
+
+    router = RouterMiddleware()
+
+    @router.route("/api/page")
+    async def page(scope, receive, send):
+        pass
+
+    target, _ = router.__dispatch__({"method": "GET", "path": "/page", "root_path": "/api"})
+    assert target is page
+
+    target, _ = router.__dispatch__({"method": "GET", "path": "/api/page", "root_path": ""})
+    assert target is page
+
+    target, _ = router.__dispatch__({"method": "GET", "path": "/api/page"})
+    assert target is page
+
+    # Misses share the read-only empty params
+    from asgi_tools.middleware import EMPTY_PARAMS
+
+    target, params = router.__dispatch__({"method": "GET", "path": "/unknown"})
+    assert target is router.app
+    assert params is EMPTY_PARAMS
+    with pytest.raises(TypeError):
+        params["name"] = "value"  # type: ignore[index]
+
+
 async def test_staticfiles_middleware(client_cls, app):
     from pathlib import Path
 
@@ -46,12 +46,19 @@ async def test_request(receive, send):
     assert request.headers["User-Agent"] == "python-httpx/0.16.1"
     assert request.url
     assert str(request.url) == "http://testserver:8000/testurl?a=1%202"
+    assert request.query == request.url.query
+    assert request.query["a"] == "1 2"
     assert request.client == ("127.0.0.1", 123)
     assert request.cookies
     assert request.cookies["session"] == "test-session"
     assert request.http_version == "1.1"
     assert request.type == "http"
     assert request["type"] == "http"
+    assert request.path == "/testurl"
+    assert request.root_path == ""
+    assert request.scheme == "http"
+    assert request.query_string == b"a=1%202"
+    assert request.server == ("testserver", 8000)
 
     formdata = await request.form()
     assert formdata
@@ -81,6 +88,21 @@ async def test_multipart(client_cls):
     assert res.headers["content-length"] == str(len('"""Test Request."""'))
 
 
+async def test_multipart_stream(gen_request):
+    from asgi_tools.tests import encode_multipart
+
+    data, content_type = encode_multipart({"name": "test", "file": open(__file__)})
+    body = [chunk + b"\n" for chunk in data.split(b"\n")]
+    req = gen_request(body=body, headers={"content-type": content_type})
+    formdata = await req.form()
+    assert formdata["name"] == "test"
+    assert formdata["file"].read().startswith(b'"""Test Request."""')
+
+    # The body is parsed from the stream and isn't kept in memory
+    with pytest.raises(RuntimeError):
+        await req.body()
+
+
 async def test_media(gen_request):
     req = gen_request()
     assert req.media
@@ -92,6 +114,63 @@ async def test_media(gen_request):
     assert req.media["content_type"]
     assert req.content_type == "text/html"
 
+    req = gen_request(headers={"content-type": "text/html; Charset=iso-8859-1"})
+    assert req.charset == "iso-8859-1"
+
+    # The media is read without parsing all the headers
+    assert req._headers is None
+
+
+async def test_mixed_case_headers(receive, send):
+    from asgi_tools import Request
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"Content-Type", b"text/html; charset=latin-1"),
+            (b"Host", b"example.com"),
+            (b"Cookie", b"a=1"),
+        ],
+    }
+    req = Request(scope, receive, send)
+    assert req.cookies == {"a": "1"}
+    assert req.content_type == "text/html"
+    assert req.charset == "latin-1"
+    assert str(req.url) == "http://example.com/"
+
+
+async def test_query(gen_request):
+    req = gen_request("/?a=1&b=&a=x+y&c=%C3%A9")
+    assert req.query.getall("a") == ["1", "x y"]
+    assert req.query["b"] == ""
+    assert req.query["c"] == "é"
+    assert req.query == req.url.query
+
+    # Invalid escapes are decoded with replacement characters
+    req = gen_request("/?a=%FF&b=1")
+    assert req.query["a"] == "\ufffd"
+    assert req.query["b"] == "1"
+
+
+async def test_body(gen_request):
+    req = gen_request(body=[b"single"])
+    assert await req.body() == b"single"
+    assert await req.body() == b"single"
+    assert [chunk async for chunk in req.stream()] == [b"single"]
+
+    req = gen_request(body=[b"first", b"-", b"second"])
+    assert await req.body() == b"first-second"
+
+    req = gen_request(body=[b"streamed"])
+    assert [chunk async for chunk in req.stream()] == [b"streamed"]
+    with pytest.raises(RuntimeError):
+        await req.body()
+
 
 async def test_json(gen_request):
     from asgi_tools.errors import ASGIDecodeError
@@ -14,6 +14,19 @@ def test_parse_options_header():
     assert ct == "form-data"
     assert opts == {"name": "test_client.py", "filename": "test_client.py"}
 
+    ct, opts = parse_options_header("text/html ; Charset=latin-1")
+    assert ct == "text/html"
+    assert opts == {"charset": "latin-1"}
+
+    ct, opts = parse_options_header(
+        "attachment; filename*=UTF-8''%e2%82%ac%20rates; title*0=foo; title*1=bar; inline",
+    )
+    assert ct == "attachment"
+    assert opts == {"filename": "€ rates", "title": "foobar", "inline": ""}
+
+    ct, opts = parse_options_header('form-data; name="a \\"b\\" c"; x=1, y=2')
+    assert opts == {"name": 'a "b" c', "x": "1", "y": "2"}
+
 
 async def test_awaitable():
     from asgi_tools.utils import is_awaitable, to_awaitable
@@ -32,3 +45,38 @@ async def test_awaitable():
     assert is_awaitable(test3)
 
     assert await to_awaitable(test1)() == 1
+
+
+def test_parse_headers():
+    from asgi_tools.utils import parse_headers
+
+    headers = parse_headers([(b"host", b"localhost"), (b"x-test", b"1"), (b"X-Test", b"\xe9")])
+    assert headers["Host"] == "localhost"
+    assert headers.getall("x-test") == ["1", "é"]
+
+
+def test_get_header():
+    from asgi_tools.utils import get_header
+
+    headers = [(b"host", b"localhost"), (b"x-test", b"1"), (b"x-test", b"2")]
+    assert get_header(headers, b"host") == b"localhost"
+    assert get_header(headers, b"x-test") == b"1"
+    assert get_header(headers, b"unknown") is None
+
+    headers = [(b"Content-Type", b"text/html"), (b"HOST", b"localhost")]
+    assert get_header(headers, b"content-type") == b"text/html"
+    assert get_header(headers, b"host") == b"localhost"
+
+
+def test_parse_cookies():
+    from asgi_tools.utils import parse_cookies
+
+    cookies = parse_cookies(b'session=test; theme="dark mode"; empty=')
+    assert cookies == {"session": "test", "theme": "dark mode", "empty": ""}
+
+    # The parsed results are cached, but every caller gets its own copy
+    cookies["session"] = "changed"
+    assert parse_cookies(b'session=test; theme="dark mode"; empty=')["session"] == "test"
+
+    cookies = parse_cookies(b'plain=a\\b; quoted="a\\"b\\054c"; half="a')
+    assert cookies == {"plain": "a\\b", "quoted": 'a"b,c', "half": '"a'}